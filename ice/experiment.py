@@ -52,9 +52,9 @@ class Experiment(object):
                 )
             )
         self.mod_file_path = file_path
-        self.mod_name = os.path.basename(self.mod_file_path).replace(
-            '.py', ''
-        )
+        self.mod_name = os.path.splitext(
+            os.path.basename(self.mod_file_path)
+        )[0]
 
         # Load module
         self.module = None
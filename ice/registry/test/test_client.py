@@ -1,9 +1,9 @@
-import unittest2
+import unittest
 from ice import entities
 from ice.registry import client
 
 
-class TestCompileUserData(unittest2.TestCase):
+class TestCompileUserData(unittest.TestCase):
     def test(self):
         # client will not try to connect to the endpoint
         c = client.RegistryClient(client.CfgRegistryClient('localhost', 8080))
@@ -1,5 +1,5 @@
 import os
-import unittest2
+import unittest
 import random
 import threading
 from ice import entities
@@ -20,7 +20,7 @@ class ServerThread(threading.Thread):
         self.server.run()
 
 
-class ServerTestCase(unittest2.TestCase):
+class ServerTestCase(unittest.TestCase):
     def setUp(self):
         self.port = random.randint(50000, 60000)
 
@@ -159,13 +159,13 @@ class TestSubmitInstance(ServerTestCase):
             public_reverse_dns='localhost',
             tags=['a_tag', 'b_tag']
         )
-        with self.assertRaisesRegex(
+        with self.assertRaisesRegexp(
             RegistryClient.APIException, 'must be of Ip type'
         ):
             self.client.submit_instance(inst)
 
         inst.public_ip_addr = '127.900.0.1'
-        with self.assertRaisesRegex(
+        with self.assertRaisesRegexp(
             RegistryClient.APIException, 'must be of Ip type'
         ):
             self.client.submit_instance(inst)
@@ -1,8 +1,8 @@
-import unittest2
+import unittest
 from ice import ascii_table
 
 
-class TestASCIITable(unittest2.TestCase):
+class TestASCIITable(unittest.TestCase):
     def test_add_column(self):
         t = ascii_table.ASCIITable()
         col = ascii_table.ASCIITableColumn('Test', 20)
@@ -76,7 +76,7 @@ class TestASCIITable(unittest2.TestCase):
         self.assertListEqual(t.rows, [])
 
 
-class TestASCIIRenderer(unittest2.TestCase):
+class TestASCIIRenderer(unittest.TestCase):
     def test_renders(self):
         table = ascii_table.ASCIITable()
         table.add_column('col_a', ascii_table.ASCIITableColumn('Column A', 30))
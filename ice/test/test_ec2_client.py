@@ -1,4 +1,4 @@
-import unittest2
+import unittest
 import mock
 from boto import ec2 as boto_ec2
 from boto import exception as boto_exception
@@ -6,7 +6,7 @@ from ice import ec2_client
 from ice.test.logger import get_dummy_logger
 
 
-class TestCfgEC2CloudAuth(unittest2.TestCase):
+class TestCfgEC2CloudAuth(unittest.TestCase):
     def setUp(self):
         self.ec2_ctr = boto_ec2.connect_to_region
         boto_ec2.connect_to_region = mock.MagicMock()
@@ -38,7 +38,7 @@ class TestCfgEC2CloudAuth(unittest2.TestCase):
         self.assertEqual(boto_ec2.connect_to_region.call_count, 1)
 
 
-class TestEC2Client(unittest2.TestCase):
+class TestEC2Client(unittest.TestCase):
     def setUp(self):
         self.cloud_auth = ec2_client.CfgEC2CloudAuth(
             'banana.aws.com',
@@ -1,8 +1,8 @@
-import unittest2
+import unittest
 from ice import entities
 
 
-class TestEntity(unittest2.TestCase):
+class TestEntity(unittest.TestCase):
     def test_to_json(self):
         e = entities.Entity()
         e.id = 'test-123'
@@ -25,7 +25,7 @@ class TestEntity(unittest2.TestCase):
         self.assertEqual(e.to_dict(), {'name': 'banana'})
 
 
-class TestSession(unittest2.TestCase):
+class TestSession(unittest.TestCase):
     def test_missing_property(self):
         with self.assertRaises(KeyError):
             entities.Session()
@@ -39,7 +39,7 @@ class TestSession(unittest2.TestCase):
         )
 
 
-class TestInstance(unittest2.TestCase):
+class TestInstance(unittest.TestCase):
     def test_with_missing_session_id(self):
         with self.assertRaises(KeyError):
             entities.Instance(
@@ -1,6 +1,7 @@
 import os
+import sys
 import types
-import unittest2
+import unittest
 import mock
 import tempfile
 import fabric.api as fabric_api
@@ -14,9 +15,29 @@ ASSETS_PATH = os.path.abspath(
         os.path.dirname(__file__), '..', '..', 'testing', 'assets'
     )
 )
+EXP_NORMAL_PATH = os.path.join(ASSETS_PATH, 'exp_normal.py')
 
+_old_dont_write_bytecode = None
 
-class TestExperimentConstructor(unittest2.TestCase):
+
+def setUpModule():
+    global _old_dont_write_bytecode
+
+    # Experiments loaded from temporary files should not leave stale .pyc
+    # files behind them.
+    _old_dont_write_bytecode = sys.dont_write_bytecode
+    sys.dont_write_bytecode = True
+
+
+def tearDownModule():
+    sys.dont_write_bytecode = _old_dont_write_bytecode
+
+
+def _modname(file_path):
+    return os.path.splitext(os.path.basename(file_path))[0]
+
+
+class TestExperimentConstructor(unittest.TestCase):
     def setUp(self):
         self.old_exp_load = experiment.Experiment.load
         experiment.Experiment.load = mock.MagicMock()
@@ -41,46 +62,45 @@ class TestExperimentConstructor(unittest2.TestCase):
             )
 
     def test_file_no_python(self):
-        tmp_file = tempfile.NamedTemporaryFile()
+        with mock.patch.object(os.path, 'isfile', return_value=True):
+            with self.assertRaises(experiment.Experiment.LoadError):
+                experiment.Experiment(
+                    self.logger,
+                    '/path/to/exp_file'
+                )
 
-        with self.assertRaises(experiment.Experiment.LoadError):
+    def test_calls_load(self):
+        with mock.patch.object(os.path, 'isfile', return_value=True):
             experiment.Experiment(
                 self.logger,
-                tmp_file.name
+                '/path/to/exp_file.py'
             )
-
-        tmp_file.close()
-
-    def test_calls_load(self):
-        tmp_file = tempfile.NamedTemporaryFile(suffix='.py')
-
-        experiment.Experiment(
-            self.logger,
-            tmp_file.name
-        )
         self.assertEqual(experiment.Experiment.load.call_count, 1)
 
-        tmp_file.close()
-
     def test_members(self):
-        tmp_file = tempfile.NamedTemporaryFile(suffix='.py')
+        file_path = '/path/to/exp_file.py'
 
-        exp = experiment.Experiment(
-            self.logger,
-            tmp_file.name
-        )
+        with mock.patch.object(os.path, 'isfile', return_value=True):
+            exp = experiment.Experiment(
+                self.logger,
+                file_path
+            )
 
-        self.assertEqual(exp.mod_file_path, tmp_file.name)
-        self.assertEqual(
-            exp.mod_name,
-            os.path.basename(tmp_file.name).replace('.py', '')
-        )
+        self.assertEqual(exp.mod_file_path, file_path)
+        self.assertEqual(exp.mod_name, 'exp_file')
         self.assertIsNone(exp.module)
 
-        tmp_file.close()
+    def test_mod_name_strips_extension_only(self):
+        with mock.patch.object(os.path, 'isfile', return_value=True):
+            exp = experiment.Experiment(
+                self.logger,
+                '/path/to/a.pyfoo.py'
+            )
+
+        self.assertEqual(exp.mod_name, 'a.pyfoo')
 
 
-class TestLoad(unittest2.TestCase):
+class TestLoad(unittest.TestCase):
     def setUp(self):
         self.logger = get_dummy_logger('experiment')
 
@@ -94,8 +114,7 @@ class TestLoad(unittest2.TestCase):
 
         self.assertIsInstance(exp.module, types.ModuleType)
 
-        mod_name = os.path.basename(tmp_file.name).replace('.py', '')
-        self.assertEqual(exp.module.__name__, mod_name)
+        self.assertEqual(exp.module.__name__, _modname(tmp_file.name))
 
         tmp_file.close()
 
@@ -109,43 +128,34 @@ class TestLoad(unittest2.TestCase):
             )
 
     def test_reload(self):
-        tmp_file = tempfile.NamedTemporaryFile(suffix='.py', delete=False)
+        fd, tmp_file_path = tempfile.mkstemp(suffix='.py')
+        os.close(fd)
+        self.addCleanup(os.unlink, tmp_file_path)
 
         exp = experiment.Experiment(
             self.logger,
-            tmp_file.name
+            tmp_file_path
         )
 
         with self.assertRaises(AttributeError):
             exp.module.a_func
 
-        tmp_file.write("""def a_func():
+        with open(tmp_file_path, 'w') as tmp_file:
+            tmp_file.write("""def a_func():
     pass""")
-        tmp_file.file.flush()
-
-        # Remove compiled file to speed up things.
-        #   This is necessary to make test realistic. It seems that there
-        #   is a race between changing the code of the .py file and the
-        #   .pyc file becoming invalidated.
-        os.remove(tmp_file.name + 'c')
 
         exp.load()
         self.assertIsInstance(exp.module.a_func, types.FunctionType)
 
-        tmp_file.close()
-
-
-class TestGetContents(unittest2.TestCase):
-    def setUp(self):
-        mod_file_path = os.path.abspath(
-            os.path.join(ASSETS_PATH, 'exp_normal.py')
-        )
 
-        self.logger = get_dummy_logger('experiment')
+class TestGetContents(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.logger = get_dummy_logger('experiment')
 
-        self.exp = experiment.Experiment(
-            self.logger,
-            mod_file_path
+        cls.exp = experiment.Experiment(
+            cls.logger,
+            EXP_NORMAL_PATH
         )
 
     def test_get_runners(self):
@@ -170,21 +180,26 @@ class TestGetContents(unittest2.TestCase):
         )
 
 
-class TestRun(unittest2.TestCase):
-    def setUp(self):
-        self.logger = get_dummy_logger('experiment')
-        self.ssh_cfg = experiment.CfgSSH('ice', '/path/to/id_rsa')
+class TestRun(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.logger = get_dummy_logger('experiment')
+        cls.ssh_cfg = experiment.CfgSSH('ice', '/path/to/id_rsa')
 
         # Load placeholder experiment. By doing so, following tests can
         # overwrite functions in this module with mocks.
-        mod_file_path = os.path.abspath(
-            os.path.join(ASSETS_PATH, 'exp_normal.py')
-        )
-        self.exp = experiment.Experiment(
-            self.logger,
-            mod_file_path
+        cls.exp = experiment.Experiment(
+            cls.logger,
+            EXP_NORMAL_PATH
         )
 
+    def setUp(self):
+        self.orig_run_a = self.exp.module.run_a
+
+    def tearDown(self):
+        # The module is shared between tests, so undo any mocked runner.
+        self.exp.module.run_a = self.orig_run_a
+
     def _make_instance(self, hostname):
         return entities.Instance(
             session_id='test',
@@ -269,22 +284,20 @@ class TestRun(unittest2.TestCase):
         )
 
     def test_task(self):
-        old_fab_execute = fabric_api.execute
-        fabric_api.execute = mock.MagicMock(return_value={'test': 12})
-
         inst_1 = self._make_instance('host1')
         inst_2 = self._make_instance('host2')
-        self.assertEqual(
-            self.exp.run([inst_1, inst_2], self.ssh_cfg, func_name='task_a_a',
-                         args=[12, 'test_1', 'test_2']),
-            {'test': 12}
-        )
-        fabric_api.execute.assert_called_once_with(
-            self.exp.module.task_a_a,
-            [inst_1, inst_2], 12, 'test_1', 'test_2'
-        )
-
-        fabric_api.execute = old_fab_execute
+        with mock.patch.object(fabric_api, 'execute',
+                               return_value={'test': 12}) as execute_mock:
+            self.assertEqual(
+                self.exp.run([inst_1, inst_2], self.ssh_cfg,
+                             func_name='task_a_a',
+                             args=[12, 'test_1', 'test_2']),
+                {'test': 12}
+            )
+            execute_mock.assert_called_once_with(
+                self.exp.module.task_a_a,
+                [inst_1, inst_2], 12, 'test_1', 'test_2'
+            )
 
     def test_parallel_runner(self):
         mock_runner = mock.MagicMock(return_value='runner-return-value')
@@ -299,26 +312,21 @@ class SettingsMock(object):
     def __init__(self, test):
         self.test = test
         self.logged_settings = {}
-        self.old_fab_settings = None
+        self.patcher = mock.patch.object(
+            fabric_api, 'settings', side_effect=self._log_settings
+        )
 
     def _log_settings(self, **kwargs):
         for key, value in kwargs.items():
             self.logged_settings[key] = value
-        return self
+        return mock.MagicMock()  # usable as a context manager
 
     def __enter__(self):
-        self.old_fab_settings = fabric_api.settings
-
-        fabric_api.settings = mock.MagicMock(
-            side_effect=self._log_settings
-        )
-        fabric_api.settings.__enter__ = mock.MagicMock()
-        fabric_api.settings.__exit__ = mock.MagicMock(return_value=True)
-
+        self.patcher.start()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        fabric_api.settings = self.old_fab_settings
+        self.patcher.stop()
 
     def assert_setting(self, key, value):
         self.test.assertEqual(self.logged_settings[key], value)
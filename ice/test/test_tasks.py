@@ -1,4 +1,4 @@
-import unittest2
+import unittest
 from ice import tasks
 import fabric.api as fabric_api
 
@@ -10,7 +10,7 @@ def a_func(*args, **kwargs):
     return ret_val
 
 
-class TestCallable(unittest2.TestCase):
+class TestCallable(unittest.TestCase):
     def test_help_message(self):
         c = tasks.Callable(a_func)
         self.assertEqual(c.help_msg, 'A help message')
@@ -55,7 +55,7 @@ def mock_decorator(func):
     return decorated_func
 
 
-class TestTask(unittest2.TestCase):
+class TestTask(unittest.TestCase):
     def setUp(self):
         self.fa_task = fabric_api.task
         fabric_api.task = mock_decorator
@@ -75,7 +75,7 @@ class TestTask(unittest2.TestCase):
         )
 
 
-class TestParallelTask(unittest2.TestCase):
+class TestParallelTask(unittest.TestCase):
     def setUp(self):
         self.fa_parallel = fabric_api.parallel
         fabric_api.parallel = mock_decorator